@@ -1,10 +1,10 @@
 import os
-import json
 from typing import Dict, Any, List
 from datetime import datetime
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+import orjson
 import prometheus_client
 
 from logger_config import get_logger
@@ -127,8 +127,8 @@ def store_arbitrage_opportunity(opportunity: Dict[str, Any]):
         filename = f"opportunity_{datetime.now().isoformat().replace(':', '-')}.json"
         filepath = os.path.join(opportunities_dir, filename)
         
-        with open(filepath, 'w') as f:
-            json.dump(opportunity, f, indent=2)
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(opportunity, option=orjson.OPT_INDENT_2))
         
     except Exception as e:
         logger.error(f"Error storing arbitrage opportunity: {e}")
@@ -155,8 +155,8 @@ def store_top_trading_pairs(pairs: Dict[str, Any]):
         filename = f"pairs_{datetime.now().isoformat().replace(':', '-')}.json"
         filepath = os.path.join(pairs_dir, filename)
         
-        with open(filepath, 'w') as f:
-            json.dump(pairs, f, indent=2)
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(pairs, option=orjson.OPT_INDENT_2))
         
     except Exception as e:
         logger.error(f"Error storing trading pairs: {e}")
@@ -13,13 +13,41 @@ from web3 import Web3
 from logger_config import get_logger
 from api_service import store_arbitrage_opportunity, store_top_trading_pairs
 from chain_config import CHAIN_CONFIG, validate_chain_config
-from gas_manager import GasManager
+from multi_source_gas_manager import MultiSourceGasManager
 from fund_manager import FundManager
 from connectors.connector_factory import ConnectorFactory
 
 # Import logging
 logger = get_logger()
 
+async def get_ticker_prices(exchange, symbols):
+    """
+    Fetch last prices for several symbols from a single exchange
+    
+    Uses one batched fetch_tickers request when the exchange supports it,
+    otherwise falls back to concurrent per-symbol fetch_ticker calls.
+    
+    Args:
+        exchange: ccxt (async) exchange instance
+        symbols (list): Trading pair symbols
+    
+    Returns:
+        dict: Last price per symbol for the symbols the exchange returned
+    """
+    if exchange.has.get('fetchTickers'):
+        tickers = await exchange.fetch_tickers(symbols)
+    else:
+        results = await asyncio.gather(
+            *[exchange.fetch_ticker(symbol) for symbol in symbols]
+        )
+        tickers = dict(zip(symbols, results))
+    
+    return {
+        symbol: tickers[symbol].get('last')
+        for symbol in symbols
+        if symbol in tickers
+    }
+
 class ArbitrageDetector:
     def __init__(self, wallet_address):
         """
@@ -33,7 +61,7 @@ class ArbitrageDetector:
         
         self.wallet_address = wallet_address
         self.w3 = self._initialize_web3()
-        self.gas_manager = GasManager(self.w3)
+        self.gas_manager = self._initialize_gas_manager()
         self.fund_manager = FundManager(self.w3, self.gas_manager)
         
         # Initialize multi-exchange connector
@@ -99,6 +127,21 @@ class ArbitrageDetector:
         
         raise ConnectionError("Could not establish Web3 connection to any provider")
     
+    def _initialize_gas_manager(self):
+        """
+        Initialize gas pricing across the primary and fallback RPC providers
+        
+        Returns:
+            MultiSourceGasManager: Gas manager taking the median across providers
+        """
+        rpc_urls = [self.w3.provider.endpoint_uri]
+        for env_var in ('ALCHEMY_RPC_URL', 'POCKET_NETWORK_RPC'):
+            url = os.getenv(env_var)
+            if url and url not in rpc_urls:
+                rpc_urls.append(url)
+        
+        return MultiSourceGasManager.from_rpc_urls(rpc_urls)
+    
     def _initialize_multi_exchange_connector(self):
         """
         Initialize multi-exchange connector
@@ -109,11 +152,19 @@ class ArbitrageDetector:
         try:
             # Use ConnectorFactory to create multi-exchange connector
             connector = ConnectorFactory.create_connector()
-            logger.info("Initialized multi-exchange connector")
-            return connector
         except Exception as e:
             logger.error(f"Failed to initialize multi-exchange connector: {e}")
             return None
+        
+        if not connector.exchanges:
+            # Every exchange failed to initialize; drop the factory's cached
+            # connector so the next attempt rebuilds it
+            logger.warning("Multi-exchange connector has no initialized exchanges")
+            ConnectorFactory.invalidate_connector()
+            return None
+        
+        logger.info("Initialized multi-exchange connector")
+        return connector
     
     async def fetch_top_trading_pairs(self):
         """
@@ -122,6 +173,10 @@ class ArbitrageDetector:
         Returns:
             dict: Top trading pairs with their market data
         """
+        if not self.multi_exchange_connector:
+            # Retry a connector that failed to initialize earlier
+            self.multi_exchange_connector = self._initialize_multi_exchange_connector()
+        
         if not self.multi_exchange_connector:
             logger.warning("Multi-exchange connector not initialized")
             return {}
@@ -139,6 +194,46 @@ class ArbitrageDetector:
             logger.error(f"Error fetching top trading pairs: {e}")
             return {}
     
+    async def refresh_ticker_prices(self, top_pairs):
+        """
+        Refresh last prices of the tracked pairs before detection
+        
+        Used when the top pairs snapshot was served from the connector's
+        cache, so its prices are re-read with one ticker request per
+        exchange, all exchanges queried concurrently. Exchanges that fail
+        keep their snapshot prices.
+        
+        Args:
+            top_pairs (dict): Top trading pairs per exchange
+        
+        Returns:
+            dict: Market data with current last prices
+        """
+        exchanges = self.multi_exchange_connector.exchanges if self.multi_exchange_connector else {}
+        names = [
+            name for name in top_pairs
+            if top_pairs[name] and hasattr(exchanges.get(name), 'fetch_ticker')
+        ]
+        
+        results = await asyncio.gather(
+            *[get_ticker_prices(exchanges[name], list(top_pairs[name])) for name in names],
+            return_exceptions=True
+        )
+        
+        market_data = dict(top_pairs)
+        for name, result in zip(names, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Error refreshing ticker prices from {name}: {result}")
+                continue
+            
+            # Copy so the connector's cached snapshot is left untouched
+            market_data[name] = {
+                pair: {**data, 'last_price': result.get(pair) or data.get('last_price', 0)}
+                for pair, data in top_pairs[name].items()
+            }
+        
+        return market_data
+    
     async def detect_arbitrage_opportunities(self, market_data):
         """
         Detect potential arbitrage opportunities across multiple markets
@@ -233,13 +328,32 @@ class ArbitrageDetector:
         """Main arbitrage detection and execution loop"""
         check_interval = int(os.getenv('ARBITRAGE_CHECK_INTERVAL', 60))
         
+        try:
+            await self._run_arbitrage_loop(check_interval)
+        finally:
+            await self.gas_manager.close()
+    
+    async def _run_arbitrage_loop(self, check_interval):
+        """
+        Repeatedly detect and process arbitrage opportunities
+        
+        Args:
+            check_interval (int): Seconds to wait between passes
+        """
         while True:
             try:
                 # Fetch top trading pairs
                 top_pairs = await self.fetch_top_trading_pairs()
                 
+                # Re-read prices only for a cached snapshot; a freshly
+                # fetched one already carries current prices
+                if self.multi_exchange_connector and self.multi_exchange_connector.top_pairs_from_cache:
+                    market_data = await self.refresh_ticker_prices(top_pairs)
+                else:
+                    market_data = top_pairs
+                
                 # Detect arbitrage opportunities
-                opportunities = await self.detect_arbitrage_opportunities(top_pairs)
+                opportunities = await self.detect_arbitrage_opportunities(market_data)
                 
                 # Process and potentially execute opportunities
                 for opportunity in opportunities:
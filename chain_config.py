@@ -9,6 +9,46 @@ class ChainConfigurationError(Exception):
     """Custom exception for chain configuration errors"""
     pass
 
+# Chain configuration schema
+CHAIN_CONFIG_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "patternProperties": {
+        "^[a-z_]+$": {
+            "type": "object",
+            "required": ["chain_id", "rpc_url"],
+            "properties": {
+                "chain_id": {"type": "number"},
+                "rpc_url": {"type": "string"},
+                "native_token": {
+                    "type": "object",
+                    "required": ["symbol", "decimals"],
+                    "properties": {
+                        "symbol": {"type": "string"},
+                        "decimals": {"type": "number"}
+                    }
+                },
+                "dexes": {
+                    "type": "object",
+                    "patternProperties": {
+                        "^[a-z_]+$": {
+                            "type": "object",
+                            "required": ["router_address"],
+                            "properties": {
+                                "router_address": {"type": "string"},
+                                "factory_address": {"type": "string"}
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+}
+
+# Checked and compiled once so validation does not rebuild it per call
+jsonschema.Draft7Validator.check_schema(CHAIN_CONFIG_SCHEMA)
+_CHAIN_CONFIG_VALIDATOR = jsonschema.Draft7Validator(CHAIN_CONFIG_SCHEMA)
+
 def validate_chain_config(config: Dict[str, Any]):
     """
     Validate blockchain configuration
@@ -19,43 +59,8 @@ def validate_chain_config(config: Dict[str, Any]):
     Raises:
         ChainConfigurationError: If configuration is invalid
     """
-    chain_config_schema = {
-        "type": "object",
-        "patternProperties": {
-            "^[a-z_]+$": {
-                "type": "object",
-                "required": ["chain_id", "rpc_url"],
-                "properties": {
-                    "chain_id": {"type": "number"},
-                    "rpc_url": {"type": "string"},
-                    "native_token": {
-                        "type": "object",
-                        "required": ["symbol", "decimals"],
-                        "properties": {
-                            "symbol": {"type": "string"},
-                            "decimals": {"type": "number"}
-                        }
-                    },
-                    "dexes": {
-                        "type": "object",
-                        "patternProperties": {
-                            "^[a-z_]+$": {
-                                "type": "object",
-                                "required": ["router_address"],
-                                "properties": {
-                                    "router_address": {"type": "string"},
-                                    "factory_address": {"type": "string"}
-                                }
-                            }
-                        }
-                    }
-                }
-            }
-        }
-    }
-    
     try:
-        jsonschema.validate(instance=config, schema=chain_config_schema)
+        _CHAIN_CONFIG_VALIDATOR.validate(config)
     except jsonschema.ValidationError as e:
         raise ChainConfigurationError(f"Invalid chain configuration: {e}")
 
@@ -67,6 +67,10 @@ class ConfigManager:
             "required": ["wallet_address", "web3_provider_url"]
         }
         
+        # Check and compile the schema once instead of on every validation
+        jsonschema.Draft7Validator.check_schema(self._config_schema)
+        self._config_validator = jsonschema.Draft7Validator(self._config_schema)
+        
         # Load configuration
         self._config = self._load_config(config_path)
     
@@ -167,7 +171,7 @@ class ConfigManager:
             jsonschema.ValidationError: If configuration is invalid
         """
         try:
-            jsonschema.validate(instance=config, schema=self._config_schema)
+            self._config_validator.validate(config)
         except jsonschema.ValidationError as e:
             raise ValueError(f"Invalid configuration: {e}")
     
@@ -1,10 +1,13 @@
 """Connector Factory Implementation with Multi-Exchange Support"""
-from typing import Union
+from typing import Dict, Union
 from connectors.multi_exchange_connector import MultiExchangeConnector
 
 class ConnectorFactory:
     """Factory for creating multi-exchange connectors"""
     
+    # Connectors already built, keyed by configuration path
+    _connectors: Dict[str, MultiExchangeConnector] = {}
+    
     @staticmethod
     def create_connector(
         config_path: str = 'config/exchanges.yaml'
@@ -12,13 +15,30 @@ class ConnectorFactory:
         """
         Create a multi-exchange connector
         
+        Connectors are cached per configuration path, so repeated calls
+        reuse the parsed configuration and initialized exchange clients.
+        
         Args:
             config_path (str): Path to exchanges configuration file
         
         Returns:
             MultiExchangeConnector: Initialized multi-exchange connector
         """
-        return MultiExchangeConnector(config_path)
+        connector = ConnectorFactory._connectors.get(config_path)
+        if connector is None:
+            connector = MultiExchangeConnector(config_path)
+            ConnectorFactory._connectors[config_path] = connector
+        return connector
+    
+    @staticmethod
+    def invalidate_connector(config_path: str = 'config/exchanges.yaml'):
+        """
+        Drop a cached connector so the next call rebuilds it
+        
+        Args:
+            config_path (str): Path to exchanges configuration file
+        """
+        ConnectorFactory._connectors.pop(config_path, None)
     
     @staticmethod
     def create_web3_wallet(
@@ -41,7 +61,7 @@ class ConnectorFactory:
         """
         try:
             # Use MultiExchangeConnector to create wallet
-            connector = MultiExchangeConnector()
+            connector = ConnectorFactory.create_connector()
             
             # Placeholder for wallet creation method
             # In a real implementation, this would use the specific exchange's Web3 API
@@ -1,8 +1,11 @@
 """OKX Connector Implementation with Multi-Exchange Support"""
 import os
+import time
+import asyncio
+import heapq
 import yaml
 from dotenv import load_dotenv
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 
 class MultiExchangeConnector:
@@ -27,6 +30,21 @@ class MultiExchangeConnector:
         """
         self.config = self._load_config(config_path)
         self.exchanges = {}
+        
+        # Web3 instances keyed by RPC URL, shared by DEXes on the same node
+        self._web3_instances: Dict[str, Any] = {}
+        
+        # Last top-pairs snapshot as (fetched_at, limit, pairs). Meant for
+        # ArbitrageDetector: it re-ranks pairs once per TTL and re-reads
+        # prices of cached pairs every check, so the TTL spans several
+        # ARBITRAGE_CHECK_INTERVAL passes
+        self.top_pairs_cache_ttl = float(os.getenv('TOP_PAIRS_CACHE_TTL', 300))
+        self._top_pairs_cache: Tuple[float, int, Dict[str, Dict[str, Any]]] = (0.0, 0, {})
+        
+        # Whether the last fetch_top_trading_pairs call was served from the
+        # cache, i.e. its prices may be up to one TTL old
+        self.top_pairs_from_cache = False
+        
         self._initialize_exchanges()
     
     def _load_config(self, config_path: str) -> Dict[str, Any]:
@@ -120,8 +138,7 @@ class MultiExchangeConnector:
         )
         # Use Web3 for DEX initialization
         try:
-            from web3 import Web3
-            w3 = Web3(Web3.HTTPProvider(rpc_url))
+            w3 = self._get_web3(rpc_url)
             
             # Placeholder for DEX-specific initialization
             # In a real implementation, you'd use specific DEX contract ABIs
@@ -133,44 +150,102 @@ class MultiExchangeConnector:
         except Exception as e:
             print(f"Error initializing DEX {exchange_name} on {chain}: {e}")
     
+    def _get_web3(self, rpc_url: str) -> Any:
+        """
+        Get a Web3 instance for an RPC URL, creating it on first use
+        
+        DEXes resolving to the same node share one provider and therefore
+        one pooled HTTP session instead of each paying connection setup.
+        
+        Args:
+            rpc_url (str): RPC endpoint URL
+        
+        Returns:
+            Web3: Shared Web3 instance for the endpoint
+        """
+        w3 = self._web3_instances.get(rpc_url)
+        if w3 is None:
+            from web3 import Web3
+            w3 = Web3(Web3.HTTPProvider(rpc_url))
+            self._web3_instances[rpc_url] = w3
+        return w3
+    
     async def fetch_top_trading_pairs(self, limit: int = 50) -> Dict[str, Dict[str, Any]]:
         """
         Fetch top trading pairs across all initialized exchanges
         
+        Results are reused for `top_pairs_cache_ttl` seconds, so repeated
+        calls within one refresh window do not hit the exchanges again.
+        Snapshots where any exchange failed are not cached, so an outage
+        is retried on the next call.
+        
         Args:
             limit (int): Number of top pairs to fetch
         
         Returns:
             Dict of top trading pairs from different exchanges
         """
-        top_pairs = {}
+        fetched_at, cached_limit, cached_pairs = self._top_pairs_cache
+        if cached_limit == limit and time.monotonic() - fetched_at < self.top_pairs_cache_ttl:
+            self.top_pairs_from_cache = True
+            return cached_pairs
         
-        for exchange_name, exchange in self.exchanges.items():
-            try:
-                if hasattr(exchange, 'fetch_tickers'):
-                    # CCXT-style exchanges
-                    tickers = await exchange.fetch_tickers()
-                    sorted_pairs = sorted(
-                        tickers.items(), 
-                        key=lambda x: float(x[1].get('quoteVolume', 0) or 0), 
-                        reverse=True
-                    )[:limit]
-                    
-                    top_pairs[exchange_name] = {
-                        pair: {
-                            'volume': ticker.get('quoteVolume', 0),
-                            'last_price': ticker.get('last', 0)
-                        } 
-                        for pair, ticker in sorted_pairs
-                    }
-                elif isinstance(exchange, dict) and 'web3' in exchange:
-                    # DEX placeholder (would need actual implementation)
-                    top_pairs[exchange_name] = self._fetch_dex_pairs(exchange, limit)
-            except Exception as e:
-                print(f"Error fetching pairs from {exchange_name}: {e}")
+        self.top_pairs_from_cache = False
         
+        # Query all exchanges concurrently: total latency is the slowest
+        # exchange rather than the sum of all of them
+        names = list(self.exchanges)
+        results = await asyncio.gather(
+            *[self._fetch_exchange_pairs(self.exchanges[name], limit) for name in names],
+            return_exceptions=True
+        )
+        
+        top_pairs = {}
+        failed = False
+        for exchange_name, result in zip(names, results):
+            if isinstance(result, BaseException):
+                failed = True
+                print(f"Error fetching pairs from {exchange_name}: {result}")
+            elif result is not None:
+                top_pairs[exchange_name] = result
+        
+        if not failed:
+            self._top_pairs_cache = (time.monotonic(), limit, top_pairs)
         return top_pairs
     
+    async def _fetch_exchange_pairs(self, exchange: Any, limit: int) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Fetch top trading pairs from a single exchange
+        
+        Args:
+            exchange: Initialized exchange (CCXT-style object or DEX info dict)
+            limit (int): Number of top pairs to fetch
+        
+        Returns:
+            Dict of top trading pairs, or None if the exchange type is unsupported
+        """
+        if hasattr(exchange, 'fetch_tickers'):
+            # CCXT-style exchanges
+            tickers = await exchange.fetch_tickers()
+            # Partial selection: only the top `limit` tickers are ordered
+            sorted_pairs = heapq.nlargest(
+                limit,
+                tickers.items(), 
+                key=lambda x: float(x[1].get('quoteVolume', 0) or 0)
+            )
+            
+            return {
+                pair: {
+                    'volume': ticker.get('quoteVolume', 0),
+                    'last_price': ticker.get('last', 0)
+                } 
+                for pair, ticker in sorted_pairs
+            }
+        if isinstance(exchange, dict) and 'web3' in exchange:
+            # DEX placeholder (would need actual implementation)
+            return self._fetch_dex_pairs(exchange, limit)
+        return None
+    
     def _fetch_dex_pairs(self, dex_info: Dict[str, Any], limit: int) -> Dict[str, Dict[str, float]]:
         """
         Placeholder method for fetching DEX trading pairs
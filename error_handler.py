@@ -1,4 +1,7 @@
 import traceback
+import functools
+import hashlib
+import inspect
 from typing import Optional, Any, Dict
 import logging
 import sentry_sdk
@@ -11,6 +14,45 @@ class ErrorSeverity(Enum):
     HIGH = auto()
     CRITICAL = auto()
 
+# Logging level used for each error severity
+_SEVERITY_LOG_LEVELS = {
+    ErrorSeverity.LOW: logging.INFO,
+    ErrorSeverity.MEDIUM: logging.WARNING,
+    ErrorSeverity.HIGH: logging.ERROR,
+    ErrorSeverity.CRITICAL: logging.CRITICAL
+}
+
+@functools.lru_cache(maxsize=1024)
+def _error_code_for(message: str) -> str:
+    """
+    Derive a short, stable error code from an error message
+    
+    Args:
+        message (str): Error description
+    
+    Returns:
+        str: 8-character hex error code
+    """
+    return hashlib.md5(message.encode()).hexdigest()[:8]
+
+def _sentry_enabled() -> bool:
+    """
+    Check whether Sentry is initialized with a DSN to send events to
+    
+    `sentry_sdk.init()` binds a client even without a DSN, so a bound
+    client alone does not mean events are delivered.
+    
+    Returns:
+        bool: True if captured events would be sent
+    """
+    get_client = getattr(sentry_sdk, 'get_client', None)
+    if get_client is not None:
+        # sentry-sdk 2.x
+        client = get_client()
+    else:
+        client = sentry_sdk.Hub.current.client
+    return client is not None and bool(client.dsn)
+
 class ArbitrageError(Exception):
     """Base exception for arbitrage-related errors"""
     
@@ -49,43 +91,40 @@ class ArbitrageError(Exception):
         Returns:
             str: Generated error code
         """
-        import hashlib
-        return hashlib.md5(self.message.encode()).hexdigest()[:8]
+        return _error_code_for(self.message)
     
     def _log_error(self):
         """Log error using the logging system"""
         logger = logging.getLogger('arbitrage_error')
         
-        log_method = {
-            ErrorSeverity.LOW: logger.info,
-            ErrorSeverity.MEDIUM: logger.warning,
-            ErrorSeverity.HIGH: logger.error,
-            ErrorSeverity.CRITICAL: logger.critical
-        }.get(self.severity, logger.error)
-        
-        log_method(
-            f"Error: {self.message} "
-            f"(Code: {self.error_code}, "
-            f"Severity: {self.severity.name})"
+        # Lazy %-formatting: the message is only built if the level is enabled
+        logger.log(
+            _SEVERITY_LOG_LEVELS.get(self.severity, logging.ERROR),
+            "Error: %s (Code: %s, Severity: %s)",
+            self.message,
+            self.error_code,
+            self.severity.name
         )
     
     def _report_error(self):
         """
         Report error to error tracking service (Sentry)
         
-        Captures additional context and stack trace
+        Captures additional context and stack trace. Skipped entirely when
+        Sentry has no DSN configured; otherwise the event is handed to
+        Sentry's background transport, which does not block the caller.
         """
-        try:
-            sentry_sdk.capture_exception(
-                error=self,
-                extra={
-                    'error_code': self.error_code,
-                    'severity': self.severity.name,
-                    'context': self.context
-                }
-            )
-        except Exception as e:
-            logging.error(f"Failed to report error to Sentry: {e}")
+        if not _sentry_enabled():
+            return
+        
+        sentry_sdk.capture_exception(
+            error=self,
+            extra={
+                'error_code': self.error_code,
+                'severity': self.severity.name,
+                'context': self.context
+            }
+        )
 
 class ExchangeConnectionError(ArbitrageError):
     """Error related to exchange connection issues"""
@@ -171,8 +210,22 @@ class ErrorHandler:
         Decorator to handle critical errors in methods
         
         Wraps method to catch and handle exceptions,
-        preventing application crash
+        preventing application crash. Coroutine functions get an async
+        wrapper so errors raised while awaiting them are handled too.
         """
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    error = ErrorHandler.handle_error(e)
+                    logging.critical(f"Critical error in {func.__name__}: {error}")
+                    # Optionally re-raise or take recovery action
+                    raise
+            return async_wrapper
+        
+        @functools.wraps(func)
         def wrapper(*args, **kwargs):
             try:
                 return func(*args, **kwargs)
@@ -1,6 +1,6 @@
 
-import asyncio
-from decimal import Decimal
+import time
+from decimal import Decimal, InvalidOperation
 from typing import Dict, Any, Optional, List, Union
 
 from web3 import Web3
@@ -9,10 +9,23 @@ from logger_config import get_logger
 from error_handler import ErrorHandler, ArbitrageError, ErrorSeverity
 from config_manager import config
 
+# Percentage scale for PnL calculations, built once instead of per call
+_PERCENT = Decimal(100)
+
 class Position:
     """
     Represents a trading position with detailed tracking
     """
+    __slots__ = (
+        'token',
+        'amount',
+        'exchange',
+        'entry_price',
+        'entry_timestamp',
+        'stop_loss',
+        'take_profit'
+    )
+    
     def __init__(
         self, 
         token: str, 
@@ -33,7 +46,7 @@ class Position:
         self.amount = amount
         self.exchange = exchange
         self.entry_price = entry_price
-        self.entry_timestamp = asyncio.get_event_loop().time()
+        self.entry_timestamp = time.monotonic()
         
         # Risk management attributes
         self.stop_loss = None
@@ -49,12 +62,15 @@ class Position:
         Returns:
             Decimal: Profit or loss percentage
         """
-        return ((current_price - self.entry_price) / self.entry_price) * 100
+        return ((current_price - self.entry_price) / self.entry_price) * _PERCENT
 
 class FundManager:
     """
     Manages funds, positions, and risk across multiple exchanges
     """
+    # Volatility factor used until a real volatility source is wired in
+    DEFAULT_VOLATILITY = Decimal('1.0')
+    
     def __init__(
         self, 
         w3: Web3, 
@@ -83,6 +99,9 @@ class FundManager:
         # Position tracking
         self.active_positions: Dict[str, Position] = {}
         self.position_history: List[Position] = []
+        
+        # Optimal trade sizes per token pair, valid until volatility changes
+        self._trade_size_cache: Dict[str, Decimal] = {}
     
     @ErrorHandler.critical_error_handler
     async def allocate_funds(
@@ -128,12 +147,30 @@ class FundManager:
         Returns:
             Decimal: Optimal trade amount
         """
+        cached_size = self._trade_size_cache.get(token_pair)
+        if cached_size is not None:
+            return cached_size
+        
         max_risk_amount = self.total_capital * self.max_risk_per_trade
         
         # Additional risk calculation based on token volatility
         volatility_factor = self._get_token_volatility(token_pair)
         
-        return max_risk_amount * volatility_factor
+        trade_size = max_risk_amount * volatility_factor
+        self._trade_size_cache[token_pair] = trade_size
+        return trade_size
+    
+    def invalidate_volatility(self, token_pair: str):
+        """
+        Discard the cached trade size for a token pair
+        
+        Should be called whenever new volatility data for the pair
+        becomes available.
+        
+        Args:
+            token_pair (str): Trading pair
+        """
+        self._trade_size_cache.pop(token_pair, None)
     
     def _get_token_volatility(self, token_pair: str) -> Decimal:
         """
@@ -147,7 +184,7 @@ class FundManager:
         """
         # Placeholder for more sophisticated volatility calculation
         # Could integrate with external volatility APIs or historical data
-        return Decimal('1.0')
+        return self.DEFAULT_VOLATILITY
     
     @ErrorHandler.critical_error_handler
     async def open_position(
@@ -231,8 +268,18 @@ def to_decimal(value: Union[int, float, str, Decimal]) -> Decimal:
     
     Returns:
         Decimal: Converted value
+    
+    Raises:
+        ValueError: If the value cannot be parsed as a number
     """
+    # Exact type checks keep the common int (wei) path free of str round-trips
+    value_type = type(value)
+    if value_type is Decimal:
+        return value
+    
     try:
+        if value_type is int or value_type is str:
+            return Decimal(value)
         return Decimal(str(value))
-    except (TypeError, ValueError):
+    except (TypeError, ValueError, InvalidOperation):
         raise ValueError(f"Cannot convert {value} to Decimal")
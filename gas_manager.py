@@ -1,107 +1,275 @@
+import time
 import asyncio
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
 from decimal import Decimal
 
-from web3 import Web3
+from web3 import AsyncHTTPProvider, AsyncWeb3, Web3
 from web3.middleware import ExtraDataToPOAMiddleware
 
 from logger_config import get_logger
 from error_handler import ErrorHandler, ArbitrageError, ErrorSeverity
 from config_manager import config
 
+# Wei per gwei
+GWEI = 10**9
+
 class GasStrategy:
     """
     Represents a gas pricing strategy
+    
+    All fees are integer wei, the unit nodes report and transactions use.
+    Strategies are treated as immutable once built.
     """
+    __slots__ = ('base_fee', 'priority_fee', 'max_fee', '_gas_price')
+    
     def __init__(
         self, 
-        base_fee: Decimal, 
-        priority_fee: Decimal,
-        max_fee: Optional[Decimal] = None
+        base_fee: int, 
+        priority_fee: int,
+        max_fee: Optional[int] = None
     ):
         """
         Initialize gas strategy
         
         Args:
-            base_fee (Decimal): Base blockchain gas fee
-            priority_fee (Decimal): Miner tip/priority fee
-            max_fee (Decimal, optional): Maximum acceptable gas fee
+            base_fee (int): Base blockchain gas fee in wei
+            priority_fee (int): Miner tip/priority fee in wei
+            max_fee (int, optional): Maximum acceptable gas fee in wei
         """
         self.base_fee = base_fee
         self.priority_fee = priority_fee
-        self.max_fee = max_fee or base_fee * Decimal('2')
+        self.max_fee = max_fee or base_fee * 2
+        self._gas_price: Optional[Mapping[str, int]] = None
     
-    def calculate_gas_price(self) -> Dict[str, Decimal]:
+    def calculate_gas_price(self) -> Mapping[str, int]:
         """
         Calculate optimal gas pricing
         
+        The result is computed once and shared by every caller of this
+        (cached) strategy, so it is returned as a read-only mapping; use
+        dict(...) for a mutable copy.
+        
         Returns:
-            Dict[str, Decimal]: Gas pricing parameters
+            Mapping[str, int]: Gas pricing parameters in wei
         """
-        max_priority_fee = min(
-            self.priority_fee * Decimal('1.2'),  # 20% buffer
-            self.max_fee - self.base_fee
-        )
+        if self._gas_price is None:
+            max_priority_fee = min(
+                self.priority_fee * 6 // 5,  # 20% buffer
+                self.max_fee - self.base_fee
+            )
+            
+            self._gas_price = MappingProxyType({
+                'base_fee': self.base_fee,
+                'priority_fee': max_priority_fee,
+                'max_fee_per_gas': self.max_fee
+            })
         
-        return {
-            'base_fee': self.base_fee,
-            'priority_fee': max_priority_fee,
-            'max_fee_per_gas': self.max_fee
-        }
+        return self._gas_price
 
 class GasManager:
     """
     Manages gas pricing and optimization across different blockchains
     """
-    def __init__(self, w3: Web3):
+    # Average block times in seconds; fees cannot change faster than this
+    BLOCK_TIMES: Dict[str, float] = {
+        'ethereum': 12.0,
+        'binance_smart_chain': 3.0
+    }
+    
+    def __init__(self, w3: Web3, async_w3: Optional[AsyncWeb3] = None):
         """
         Initialize GasManager
         
         Args:
             w3 (Web3): Web3 instance for blockchain interactions
+            async_w3 (AsyncWeb3, optional): Async client for gas RPCs.
+                Defaults to one connected to the same HTTP endpoint as
+                `w3`; required when `w3` uses an IPC, WebSocket or test
+                provider.
+        
+        Raises:
+            ValueError: If `async_w3` is omitted and `w3` has no HTTP endpoint
         """
+        # Gas RPCs are awaited natively so they never block the event loop;
+        # a client derived here is owned, and closed, by this manager
+        self._owns_async_w3 = async_w3 is None
+        if async_w3 is None:
+            endpoint_uri = str(getattr(w3.provider, 'endpoint_uri', None) or '')
+            if not endpoint_uri.startswith(('http://', 'https://')):
+                raise ValueError(
+                    "GasManager requires async_w3 when w3 is not HTTP-backed"
+                )
+            async_w3 = AsyncWeb3(AsyncHTTPProvider(endpoint_uri))
+            async_w3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
+        
         # Add POA middleware for networks like BSC
         w3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
         
         self.w3 = w3
+        self.async_w3 = async_w3
         self.logger = get_logger('gas_manager')
         
-        # Configuration
-        self.max_gas_price = Decimal(
-            config.get('gas.max_price_gwei', '500')
+        # Configuration (maximum gas price is configured in gwei, kept in wei)
+        self.max_gas_price = int(
+            Decimal(config.get('gas.max_price_gwei', '500')) * GWEI
         )
         self.gas_price_multiplier = Decimal(
             config.get('gas.price_multiplier', '1.2')
         )
+        
+        # Recently fetched strategies per chain as (fetched_at, strategy);
+        # the TTL defaults to the chain's block time unless overridden
+        cache_ttl = config.get('gas.cache_ttl_seconds')
+        self.gas_cache_ttl = float(cache_ttl) if cache_ttl is not None else None
+        self._gas_cache: Dict[str, Tuple[float, GasStrategy]] = {}
+        
+        # Per-chain fetch locks and background refreshes, so concurrent
+        # callers share a single RPC round-trip
+        self._fetch_locks: Dict[str, asyncio.Lock] = {}
+        self._refresh_tasks: Dict[str, asyncio.Future] = {}
+    
+    async def close(self):
+        """
+        Cancel background refreshes and close the async client if owned
+        
+        Clients passed in as `async_w3` are left open for their owner.
+        """
+        tasks = list(self._refresh_tasks.values())
+        self._refresh_tasks.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        
+        if self._owns_async_w3:
+            await self.async_w3.provider.disconnect()
     
     @ErrorHandler.critical_error_handler
     async def get_gas_price(self, chain: str = 'ethereum') -> GasStrategy:
         """
         Fetch current gas price for a specific blockchain
         
+        Strategies younger than the chain's cache TTL are returned
+        directly. Entries up to twice the TTL old are served stale while
+        a single background refresh runs. Older entries are refetched,
+        with concurrent callers waiting on the same request.
+        
         Args:
             chain (str, optional): Blockchain name. Defaults to 'ethereum'.
         
+        Returns:
+            GasStrategy: Calculated gas pricing strategy
+        """
+        ttl = self._cache_ttl(chain)
+        cached = self._gas_cache.get(chain)
+        if cached:
+            age = time.monotonic() - cached[0]
+            if age < ttl:
+                return cached[1]
+            if age < ttl * 2:
+                self._schedule_refresh(chain)
+                return cached[1]
+        
+        async with self._fetch_lock(chain):
+            # Another caller may have refreshed while we waited
+            cached = self._gas_cache.get(chain)
+            if cached and time.monotonic() - cached[0] < ttl:
+                return cached[1]
+            
+            return await self._fetch_gas_price(chain)
+    
+    def _cache_ttl(self, chain: str) -> float:
+        """
+        Get how long a cached gas strategy stays fresh for a chain
+        
+        Args:
+            chain (str): Blockchain name
+        
+        Returns:
+            float: TTL in seconds
+        """
+        if self.gas_cache_ttl is not None:
+            return self.gas_cache_ttl
+        return self.BLOCK_TIMES.get(chain, 3.0)
+    
+    def _fetch_lock(self, chain: str) -> asyncio.Lock:
+        """
+        Get the lock serializing gas fetches for a chain
+        
+        Args:
+            chain (str): Blockchain name
+        
+        Returns:
+            asyncio.Lock: Per-chain fetch lock
+        """
+        lock = self._fetch_locks.get(chain)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._fetch_locks[chain] = lock
+        return lock
+    
+    def _schedule_refresh(self, chain: str):
+        """
+        Start a background refresh for a chain unless one is running
+        
+        Args:
+            chain (str): Blockchain name
+        """
+        task = self._refresh_tasks.get(chain)
+        if task is None or task.done():
+            self._refresh_tasks[chain] = asyncio.ensure_future(
+                self._refresh_gas_price(chain)
+            )
+    
+    async def _refresh_gas_price(self, chain: str):
+        """
+        Refresh a chain's cached gas strategy, logging failures
+        
+        Args:
+            chain (str): Blockchain name
+        """
+        try:
+            async with self._fetch_lock(chain):
+                # Another caller may have refreshed while we waited
+                cached = self._gas_cache.get(chain)
+                if cached and time.monotonic() - cached[0] < self._cache_ttl(chain):
+                    return
+                
+                await self._fetch_gas_price(chain)
+        except Exception as e:
+            self.logger.warning(f"Background gas refresh failed for {chain}: {e}")
+    
+    async def _fetch_gas_price(self, chain: str) -> GasStrategy:
+        """
+        Query the node for a chain's gas price and refresh the cache
+        
+        Args:
+            chain (str): Blockchain name
+        
         Returns:
             GasStrategy: Calculated gas pricing strategy
         """
         try:
             # Fetch gas price based on blockchain
             if chain == 'ethereum':
-                base_fee = await self._get_ethereum_base_fee()
-                priority_fee = await self._get_ethereum_priority_fee()
+                base_fee, priority_fee = await self._get_ethereum_fees()
             elif chain == 'binance_smart_chain':
-                base_fee = await self._get_bsc_base_fee()
-                priority_fee = await self._get_bsc_priority_fee()
+                # Both fee lookups overlap
+                base_fee, priority_fee = await asyncio.gather(
+                    self._get_bsc_base_fee(),
+                    self._get_bsc_priority_fee()
+                )
             else:
                 raise ValueError(f"Unsupported chain: {chain}")
             
-            # Create and return gas strategy
-            return GasStrategy(
+            # Create, cache and return gas strategy
+            gas_strategy = GasStrategy(
                 base_fee=base_fee,
                 priority_fee=priority_fee,
                 max_fee=self.max_gas_price
             )
+            self._gas_cache[chain] = (time.monotonic(), gas_strategy)
+            return gas_strategy
         
         except Exception as e:
             self.logger.error(f"Gas price retrieval error for {chain}: {e}")
@@ -110,56 +278,52 @@ class GasManager:
                 severity=ErrorSeverity.HIGH
             )
     
-    async def _get_ethereum_base_fee(self) -> Decimal:
+    async def _get_ethereum_fees(self) -> Tuple[int, int]:
         """
-        Get Ethereum base fee (EIP-1559)
+        Get Ethereum base fee (EIP-1559) and priority fee in one RPC
         
-        Returns:
-            Decimal: Base fee in Gwei
-        """
-        latest_block = self.w3.eth.get_block('latest')
-        base_fee_per_gas = latest_block.get('baseFeePerGas', 0)
-        return Decimal(str(self.w3.from_wei(base_fee_per_gas, 'gwei')))
-    
-    async def _get_ethereum_priority_fee(self) -> Decimal:
-        """
-        Get Ethereum priority fee (miner tip)
+        Uses eth_feeHistory over the latest block: the last base fee
+        entry is the base fee for the next block, and the reward is the
+        median tip paid in the latest block.
         
         Returns:
-            Decimal: Priority fee in Gwei
+            Tuple[int, int]: Base fee and priority fee in wei
         """
-        # Use Web3 max priority fee method
-        try:
-            max_priority_fee = self.w3.eth.max_priority_fee
-            return Decimal(str(self.w3.from_wei(max_priority_fee, 'gwei')))
-        except Exception:
+        fee_history = await self.async_w3.eth.fee_history(1, 'latest', [50])
+        base_fee = fee_history['baseFeePerGas'][-1]
+        
+        rewards = fee_history.get('reward') or [[]]
+        if rewards[0]:
+            priority_fee = rewards[0][0]
+        else:
             # Fallback to static priority fee
-            return Decimal('2')
+            priority_fee = 2 * GWEI
+        
+        return base_fee, priority_fee
     
-    async def _get_bsc_base_fee(self) -> Decimal:
+    async def _get_bsc_base_fee(self) -> int:
         """
         Get Binance Smart Chain base fee
         
         Returns:
-            Decimal: Base fee in Gwei
+            int: Base fee in wei
         """
-        gas_price = self.w3.eth.gas_price
-        return Decimal(str(self.w3.from_wei(gas_price, 'gwei')))
+        return await self.async_w3.eth.gas_price
     
-    async def _get_bsc_priority_fee(self) -> Decimal:
+    async def _get_bsc_priority_fee(self) -> int:
         """
         Get Binance Smart Chain priority fee
         
         Returns:
-            Decimal: Priority fee in Gwei
+            int: Priority fee in wei
         """
-        return Decimal('1')
+        return 1 * GWEI
     
     def estimate_transaction_cost(
         self, 
         gas_limit: int, 
         gas_strategy: GasStrategy
-    ) -> Decimal:
+    ) -> int:
         """
         Estimate total transaction cost
         
@@ -168,14 +332,14 @@ class GasManager:
             gas_strategy (GasStrategy): Gas pricing strategy
         
         Returns:
-            Decimal: Estimated transaction cost in native token
+            int: Estimated transaction cost in wei of the native token
         """
         total_gas_price = (
             gas_strategy.base_fee + 
             gas_strategy.priority_fee
         )
         
-        return Decimal(gas_limit) * total_gas_price / Decimal('1e9')
+        return gas_limit * total_gas_price
     
     async def monitor_gas_prices(self, interval: int = 60):
         """
@@ -186,13 +350,20 @@ class GasManager:
         """
         while True:
             try:
-                # Check gas prices for multiple chains
+                # Check gas prices for multiple chains concurrently
                 chains = ['ethereum', 'binance_smart_chain']
                 gas_prices = {}
                 
-                for chain in chains:
-                    gas_strategy = await self.get_gas_price(chain)
-                    gas_prices[chain] = gas_strategy.calculate_gas_price()
+                results = await asyncio.gather(
+                    *[self.get_gas_price(chain) for chain in chains],
+                    return_exceptions=True
+                )
+                
+                for chain, result in zip(chains, results):
+                    if isinstance(result, BaseException):
+                        self.logger.error(f"Gas price monitoring error for {chain}: {result}")
+                    else:
+                        gas_prices[chain] = dict(result.calculate_gas_price())
                 
                 # Log gas prices
                 self.logger.info(f"Current Gas Prices: {gas_prices}")
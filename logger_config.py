@@ -1,19 +1,41 @@
 import os
+import atexit
+import queue
 import logging
 import structlog
-from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
+from logging.handlers import (
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+    TimedRotatingFileHandler
+)
 import sys
 
+# Set once configure_logging has run, so repeated calls are no-ops
+_logging_configured = False
+
+# Background listener writing queued records to the log files
+_file_log_listener = None
+
 def configure_logging(log_level=None):
     """
     Configure comprehensive logging with multiple handlers
     
+    File output goes through a QueueHandler drained by a QueueListener
+    thread, so callers (including the event loop) never block on disk
+    writes or rotation. Only the first call configures logging.
+    
     Args:
         log_level (str, optional): Logging level. Defaults to INFO.
     
     Returns:
         structlog logger instance
     """
+    global _logging_configured, _file_log_listener
+    if _logging_configured:
+        return get_logger()
+    _logging_configured = True
+    
     # Determine log level
     log_level = log_level or os.getenv('LOG_LEVEL', 'INFO').upper()
     numeric_level = getattr(logging, log_level)
@@ -22,6 +44,29 @@ def configure_logging(log_level=None):
     log_dir = os.path.join(os.getcwd(), 'logs')
     os.makedirs(log_dir, exist_ok=True)
 
+    # File handlers are driven by a listener thread fed through a queue
+    file_log_queue = queue.Queue(-1)
+    _file_log_listener = QueueListener(
+        file_log_queue,
+        
+        # File Handler with Rotation
+        RotatingFileHandler(
+            os.path.join(log_dir, 'arbitrage_bot.log'),
+            maxBytes=10*1024*1024,  # 10 MB
+            backupCount=5
+        ),
+        
+        # Time-based Rotation Handler
+        TimedRotatingFileHandler(
+            os.path.join(log_dir, 'arbitrage_bot_daily.log'),
+            when='midnight',
+            interval=1,
+            backupCount=30
+        )
+    )
+    _file_log_listener.start()
+    atexit.register(_file_log_listener.stop)
+
     # Configure base logging
     logging.basicConfig(
         level=numeric_level,
@@ -30,20 +75,8 @@ def configure_logging(log_level=None):
             # Console Handler
             logging.StreamHandler(sys.stdout),
             
-            # File Handler with Rotation
-            RotatingFileHandler(
-                os.path.join(log_dir, 'arbitrage_bot.log'),
-                maxBytes=10*1024*1024,  # 10 MB
-                backupCount=5
-            ),
-            
-            # Time-based Rotation Handler
-            TimedRotatingFileHandler(
-                os.path.join(log_dir, 'arbitrage_bot_daily.log'),
-                when='midnight',
-                interval=1,
-                backupCount=30
-            )
+            # Queue Handler formatting records for the file listener
+            QueueHandler(file_log_queue)
         ]
     )
 
@@ -91,14 +124,24 @@ def configure_logging(log_level=None):
 
     return logger
 
+# Loggers already created, keyed by name
+_LOGGERS = {}
+
 def get_logger(name='arbitrage_bot'):
     """
     Convenience method to get a logger
     
+    Loggers are cached by name, so repeated lookups do not go back
+    through structlog and the logging manager.
+    
     Args:
         name (str, optional): Logger name. Defaults to 'arbitrage_bot'.
     
     Returns:
         structlog logger instance
     """
-    return structlog.get_logger(name)
+    logger = _LOGGERS.get(name)
+    if logger is None:
+        logger = structlog.get_logger(name)
+        _LOGGERS[name] = logger
+    return logger
@@ -1,12 +1,113 @@
-from typing import Dict, Optional, Any, List
-import json
+import time
+import asyncio
+import statistics
+from typing import Dict, Optional, Any, List, Tuple
+
+from web3 import Web3
+
+from logger_config import get_logger
+from gas_manager import GasManager, GasStrategy
+
+__all__ = ['GasManager', 'GasStrategy', 'MultiSourceGasManager']
 
 class MultiSourceGasManager:
-    """Base class for multi-source gas management"""
+    """
+    Aggregates gas pricing from multiple sources
+    
+    Each source exposes `async get_gas_price(chain) -> GasStrategy`,
+    normally a GasManager bound to a different RPC provider.
+    """
+    
+    def __init__(self, sources: Optional[List[Any]] = None):
+        """
+        Initialize MultiSourceGasManager
+        
+        Args:
+            sources (List[Any], optional): Gas price sources to aggregate
+        """
+        self.sources = list(sources or [])
+        self.logger = get_logger('multi_source_gas_manager')
+        
+        # Failing sources per (source, chain) as (consecutive failures,
+        # skip until monotonic time), so one chain's outage spares the others
+        self.max_backoff_seconds = 300
+        self._source_state: Dict[Tuple[Any, str], Tuple[int, float]] = {}
+    
+    @classmethod
+    def from_rpc_urls(cls, rpc_urls: List[str]) -> 'MultiSourceGasManager':
+        """
+        Build a manager with one GasManager source per RPC endpoint
+        
+        Args:
+            rpc_urls (List[str]): RPC endpoint URLs
+        
+        Returns:
+            MultiSourceGasManager: Manager aggregating the endpoints
+        """
+        return cls([
+            GasManager(Web3(Web3.HTTPProvider(rpc_url)))
+            for rpc_url in rpc_urls
+        ])
     
-    def __init__(self):
-        pass
+    async def close(self):
+        """
+        Close all sources that hold network clients
+        """
+        await asyncio.gather(
+            *[source.close() for source in self.sources if hasattr(source, 'close')],
+            return_exceptions=True
+        )
     
-    def get_gas_price(self, *args, **kwargs):
-        """Placeholder method to be implemented by subclasses"""
-        raise NotImplementedError("Subclasses must implement get_gas_price method")
+    async def get_gas_price(self, chain: str = 'ethereum') -> GasStrategy:
+        """
+        Get a consensus gas strategy across all sources
+        
+        Sources are queried concurrently, so latency is bounded by the
+        slowest source rather than the sum of all of them. A source that
+        fails for a chain is skipped for that chain for an exponentially
+        growing backoff period (capped at `max_backoff_seconds`) so an
+        outage or rate limit does not slow down every lookup.
+        
+        Args:
+            chain (str, optional): Blockchain name. Defaults to 'ethereum'.
+        
+        Returns:
+            GasStrategy: Low median of base, priority and max fee across
+                sources, which keeps fees as integer wei
+        
+        Raises:
+            ValueError: If no source returned a gas price
+        """
+        now = time.monotonic()
+        active_sources = [
+            source for source in self.sources
+            if self._source_state.get((source, chain), (0, 0.0))[1] <= now
+        ]
+        
+        results = await asyncio.gather(
+            *[source.get_gas_price(chain) for source in active_sources],
+            return_exceptions=True
+        )
+        
+        strategies = []
+        for source, result in zip(active_sources, results):
+            if isinstance(result, BaseException):
+                failures = self._source_state.get((source, chain), (0, 0.0))[0] + 1
+                backoff = min(2 ** failures, self.max_backoff_seconds)
+                self._source_state[(source, chain)] = (failures, time.monotonic() + backoff)
+                self.logger.warning(
+                    f"Gas source {source!r} failed for {chain}, "
+                    f"skipping it for {backoff}s: {result}"
+                )
+            else:
+                self._source_state.pop((source, chain), None)
+                strategies.append(result)
+        
+        if not strategies:
+            raise ValueError(f"No gas price available for {chain}")
+        
+        return GasStrategy(
+            base_fee=statistics.median_low(s.base_fee for s in strategies),
+            priority_fee=statistics.median_low(s.priority_fee for s in strategies),
+            max_fee=statistics.median_low(s.max_fee for s in strategies)
+        )
@@ -25,6 +25,7 @@ setup(
         # Data Processing
         'pandas>=1.3.0',
         'numpy>=1.21.0',
+        'orjson>=3.6.0',
         
         # Error Tracking and Monitoring
         'sentry-sdk>=1.3.0',
@@ -41,7 +42,8 @@ setup(
     extras_require={
         'dev': [
             'pytest>=6.2.0',
-            'pytest-asyncio>=0.15.0',
+            'pytest-asyncio>=0.17.0',
+            'pytest-xdist>=3.0',
             'mypy>=0.910',
             'black>=21.5b1',
             'flake8>=3.9.0'
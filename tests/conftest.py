@@ -1,27 +1,60 @@
 import pytest
 import os
 import sys
+import queue
 import logging
+from logging.handlers import QueueHandler, QueueListener
 
 # Add the project root directory to Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+# Settings the config singleton validates at import time
+os.environ.setdefault('WALLET_ADDRESS', '0x1234567890123456789012345678901234567890')
+os.environ.setdefault('WEB3_PROVIDER_URL', 'http://localhost:8545')
+for _key in ('BINANCE_API_KEY', 'BINANCE_SECRET_KEY', 'OKX_API_KEY', 'OKX_SECRET_KEY'):
+    os.environ.setdefault(_key, 'test')
+
+# Background listener writing queued test log records
+_log_listener = None
+
 def pytest_configure(config):
     """
     Configure pytest settings and logging
+    
+    Tests only enqueue log records; a QueueListener thread writes them to
+    stdout and the log file so tests never block on disk I/O. Under
+    pytest-xdist each worker writes its own log file.
     """
+    global _log_listener
+
+    # Create test logs directory before the file handler opens its file
+    os.makedirs('tests/test_logs', exist_ok=True)
+    worker = os.environ.get('PYTEST_XDIST_WORKER')
+    log_file = f'tests/test_logs/pytest-{worker}.log' if worker else 'tests/test_logs/pytest.log'
+
+    log_queue = queue.Queue(-1)
+    _log_listener = QueueListener(
+        log_queue,
+        logging.StreamHandler(sys.stdout),
+        logging.FileHandler(log_file)
+    )
+    _log_listener.start()
+
     # Configure logging for tests
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-            logging.FileHandler('tests/test_logs/pytest.log')
-        ]
+        handlers=[QueueHandler(log_queue)]
     )
 
-    # Create test logs directory if it doesn't exist
-    os.makedirs('tests/test_logs', exist_ok=True)
+def pytest_unconfigure(config):
+    """
+    Flush queued log records and stop the logging listener
+    """
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
 
 def pytest_addoption(parser):
     """
@@ -83,7 +116,7 @@ def mock_exchanges():
     """
     Fixture to provide mock exchanges for testing
     """
-    from unittest.mock import MagicMock
+    from unittest.mock import AsyncMock, MagicMock
     
     # Create mock exchanges with predefined behaviors
     exchanges = {
@@ -92,10 +125,14 @@ def mock_exchanges():
         'coinbase': MagicMock()
     }
     
-    # Configure default mock behaviors
-    exchanges['binance'].fetch_ticker.return_value = {'bid': 2000}
-    exchanges['okx'].fetch_ticker.return_value = {'bid': 1950}
-    exchanges['coinbase'].fetch_ticker.return_value = {'bid': 1975}
+    # Configure default mock behaviors: batched tickers, one request per exchange
+    prices = {'binance': 2000, 'okx': 1950, 'coinbase': 1975}
+    for name, exchange in exchanges.items():
+        exchange.has = {'fetchTickers': True}
+        exchange.fetch_tickers = AsyncMock(
+            return_value={'WETH/USDC': {'last': prices[name]}}
+        )
+        exchange.fetch_ticker = AsyncMock(return_value={'last': prices[name]})
     
     return exchanges
 
@@ -1,136 +1,241 @@
 import pytest
 import asyncio
 from unittest.mock import AsyncMock, patch, MagicMock
-from decimal import Decimal
 
 # Import the modules to be tested
-from arbitrage_detector import (
-    detect_arbitrage_opportunity, 
-    fetch_top_pairs, 
-    get_ticker_price
-)
-from multi_source_gas_manager import GasManager
-from fund_manager import FundManager
+from arbitrage_detector import ArbitrageDetector, get_ticker_prices
+from connectors.multi_exchange_connector import MultiExchangeConnector
 
 class TestArbitrageDetector:
     @pytest.fixture
-    def mock_gas_manager(self):
-        """Create a mock GasManager"""
-        gas_manager = MagicMock(spec=GasManager)
-        gas_manager.estimate_transaction_gas_cost.return_value = Decimal('0.01')
-        gas_manager.is_gas_price_reasonable.return_value = True
-        gas_manager.get_gas_price_trend.return_value = 'stable'
-        return gas_manager
-
-    @pytest.fixture
-    def mock_fund_manager(self):
-        """Create a mock FundManager"""
-        fund_manager = MagicMock(spec=FundManager)
-        fund_manager.get_wallet_balance.return_value = Decimal('1000')
-        fund_manager.calculate_max_position_size.return_value = {
-            'max_size': Decimal('0.5'),
-            'required_margin': Decimal('100'),
-            'liquidation_price': Decimal('1900')
+    def detector(self, mock_exchanges):
+        """Create an ArbitrageDetector without web3 or exchange connections"""
+        with patch.object(ArbitrageDetector, '_validate_environment'), \
+                patch.object(ArbitrageDetector, '_initialize_web3'), \
+                patch.object(ArbitrageDetector, '_initialize_gas_manager'), \
+                patch('arbitrage_detector.FundManager'), \
+                patch.object(ArbitrageDetector, '_initialize_multi_exchange_connector') as init_connector:
+            init_connector.return_value = MagicMock(exchanges=mock_exchanges)
+            detector = ArbitrageDetector('0x1234567890123456789012345678901234567890')
+
+        detector.min_arbitrage_profit = 0.5
+        return detector
+
+    @staticmethod
+    def snapshot(*exchange_names):
+        """Build a top pairs snapshot tracking WETH/USDC on the given exchanges"""
+        return {
+            name: {'WETH/USDC': {'volume': 1000000, 'last_price': 0}}
+            for name in exchange_names
         }
-        return fund_manager
 
-    @pytest.mark.asyncio
-    async def test_detect_arbitrage_opportunity_success(
-        self, 
-        mock_gas_manager, 
-        mock_fund_manager
-    ):
+    async def test_detect_arbitrage_opportunity_success(self, detector, mock_exchanges):
         """
         Test successful arbitrage opportunity detection
         """
         # Simulate exchanges with different prices
-        exchanges = {
-            'binance': MagicMock(),
-            'okx': MagicMock()
-        }
-        exchanges['binance'].fetch_ticker.return_value = {'bid': 2000}
-        exchanges['okx'].fetch_ticker.return_value = {'bid': 1950}
+        mock_exchanges['binance'].fetch_tickers.return_value = {'WETH/USDC': {'last': 2000}}
+        mock_exchanges['okx'].fetch_tickers.return_value = {'WETH/USDC': {'last': 1950}}
+
+        market_data = await detector.refresh_ticker_prices(self.snapshot('binance', 'okx'))
+        opportunities = await detector.detect_arbitrage_opportunities(market_data)
 
-        # Wallet address for testing
-        wallet_address = '0x1234567890123456789012345678901234567890'
+        # Assertions
+        assert len(opportunities) == 2
+        assert {o['source_price'] for o in opportunities} == {2000, 1950}
+        assert all(o['token_pair'] == 'WETH/USDC' for o in opportunities)
 
-        # Simulate the detect_arbitrage_opportunity function
-        success, opportunity_id = await detect_arbitrage_opportunity(
-            mock_gas_manager, 
-            mock_fund_manager, 
-            wallet_address
+    async def test_fetch_top_pairs(self, detector):
+        """
+        Test fetching top trading pairs
+        """
+        top_pairs = {'binance': {'WETH/USDC': {'volume': 1000000, 'last_price': 2000}}}
+        detector.multi_exchange_connector.fetch_top_trading_pairs = AsyncMock(
+            return_value=top_pairs
         )
 
+        with patch('arbitrage_detector.store_top_trading_pairs') as store:
+            pairs = await detector.fetch_top_trading_pairs()
+
         # Assertions
-        assert success is True
-        assert opportunity_id is not None
+        assert pairs == top_pairs
+        store.assert_called_once_with(top_pairs)
+        detector.multi_exchange_connector.fetch_top_trading_pairs.assert_awaited_once_with(
+            limit=detector.max_pairs_to_track
+        )
 
-    @pytest.mark.asyncio
-    async def test_fetch_top_pairs(self):
+    async def test_connector_without_exchanges_is_invalidated_and_retried(self, detector):
         """
-        Test fetching top trading pairs
+        Test that a connector with no usable exchanges is dropped from the factory cache and retried
         """
-        # Mock the DexLiquidityManager
-        with patch('arbitrage_detector.DexLiquidityManager') as MockDexManager:
-            # Configure the mock to return specific pairs
-            mock_instance = MockDexManager.return_value
-            mock_instance.get_top_trading_pairs = AsyncMock(
-                return_value=['WETH/USDC', 'WBTC/USDT']
-            )
+        empty = MagicMock(exchanges={})
+        connector = MagicMock(exchanges={'binance': MagicMock()})
+        connector.fetch_top_trading_pairs = AsyncMock(return_value={})
+        detector.multi_exchange_connector = None
+
+        with patch('arbitrage_detector.ConnectorFactory') as factory, \
+                patch('arbitrage_detector.store_top_trading_pairs'):
+            factory.create_connector.side_effect = [empty, connector]
+
+            assert detector._initialize_multi_exchange_connector() is None
+            factory.invalidate_connector.assert_called_once_with()
+
+            await detector.fetch_top_trading_pairs()
+
+        assert detector.multi_exchange_connector is connector
+        connector.fetch_top_trading_pairs.assert_awaited_once()
+
+    def test_failed_connector_build_is_not_invalidated(self, detector):
+        """
+        Test that a connector build that raises has nothing cached to invalidate
+        """
+        with patch('arbitrage_detector.ConnectorFactory') as factory:
+            factory.create_connector.side_effect = RuntimeError('bad config')
 
-            # Call the function
-            pairs = await fetch_top_pairs()
+            assert detector._initialize_multi_exchange_connector() is None
 
-            # Assertions
-            assert len(pairs) > 0
-            assert 'WETH/USDC' in pairs
-            assert 'WBTC/USDT' in pairs
+        factory.invalidate_connector.assert_not_called()
 
-    def test_get_ticker_price(self):
+    async def test_gas_manager_aggregates_primary_and_fallback_rpcs(self, detector, monkeypatch):
         """
-        Test getting ticker price from an exchange
+        Test that gas prices are sourced from every configured RPC provider
         """
-        # Create a mock exchange
-        mock_exchange = MagicMock()
-        mock_exchange.fetch_ticker.return_value = {'bid': 2000}
+        monkeypatch.setenv('ALCHEMY_RPC_URL', 'https://alchemy.example/v2/key')
+        monkeypatch.setenv('POCKET_NETWORK_RPC', 'http://localhost:8545')
+        detector.w3 = MagicMock()
+        detector.w3.provider.endpoint_uri = 'http://localhost:8545'
+
+        gas_manager = detector._initialize_gas_manager()
+
+        try:
+            assert [
+                source.async_w3.provider.endpoint_uri for source in gas_manager.sources
+            ] == ['http://localhost:8545', 'https://alchemy.example/v2/key']
+        finally:
+            await gas_manager.close()
+
+    @pytest.fixture(params=['batched', 'single'])
+    def ticker_exchange(self, request):
+        """Create a mock exchange with or without fetchTickers support"""
+        tickers = {
+            'WETH/USDC': {'last': 2000},
+            'WBTC/USDT': {'last': 40000}
+        }
+        exchange = MagicMock()
+        exchange.has = {'fetchTickers': request.param == 'batched'}
+        exchange.fetch_tickers = AsyncMock(return_value=tickers)
+        exchange.fetch_ticker = AsyncMock(side_effect=lambda symbol: tickers[symbol])
+        return exchange
 
-        # Test getting price
-        price = get_ticker_price(mock_exchange, 'WETH/USDC')
+    async def test_get_ticker_prices(self, ticker_exchange):
+        """
+        Test getting ticker prices for several symbols from an exchange
+        """
+        symbols = ['WETH/USDC', 'WBTC/USDT']
+
+        # Test getting prices
+        prices = await get_ticker_prices(ticker_exchange, symbols)
 
         # Assertions
-        assert price == 2000
-        mock_exchange.fetch_ticker.assert_called_once_with('WETH/USDC')
-
-    @pytest.mark.asyncio
-    async def test_no_arbitrage_opportunity(
-        self, 
-        mock_gas_manager, 
-        mock_fund_manager
-    ):
+        assert prices == {'WETH/USDC': 2000, 'WBTC/USDT': 40000}
+        if ticker_exchange.has['fetchTickers']:
+            ticker_exchange.fetch_tickers.assert_awaited_once_with(symbols)
+            ticker_exchange.fetch_ticker.assert_not_called()
+        else:
+            assert ticker_exchange.fetch_ticker.await_count == len(symbols)
+
+    async def test_refresh_ticker_prices_one_request_per_exchange(self, detector, mock_exchanges):
         """
-        Test scenario with no arbitrage opportunity
+        Test that a detector pass queries each exchange once for all its pairs
         """
-        # Simulate exchanges with very similar prices
-        exchanges = {
-            'binance': MagicMock(),
-            'okx': MagicMock()
+        top_pairs = {
+            name: {
+                'WETH/USDC': {'volume': 1000000, 'last_price': 0},
+                'WBTC/USDT': {'volume': 500000, 'last_price': 0}
+            }
+            for name in mock_exchanges
         }
-        exchanges['binance'].fetch_ticker.return_value = {'bid': 2000}
-        exchanges['okx'].fetch_ticker.return_value = {'bid': 2005}
 
-        # Wallet address for testing
-        wallet_address = '0x1234567890123456789012345678901234567890'
+        market_data = await detector.refresh_ticker_prices(top_pairs)
+
+        for name, exchange in mock_exchanges.items():
+            exchange.fetch_tickers.assert_awaited_once_with(['WETH/USDC', 'WBTC/USDT'])
+            exchange.fetch_ticker.assert_not_called()
+            assert market_data[name]['WETH/USDC']['last_price'] > 0
 
-        # Simulate the detect_arbitrage_opportunity function
-        success, opportunity_id = await detect_arbitrage_opportunity(
-            mock_gas_manager, 
-            mock_fund_manager, 
-            wallet_address
+        # The connector's cached snapshot is not modified
+        assert all(
+            data['last_price'] == 0
+            for pairs in top_pairs.values()
+            for data in pairs.values()
         )
 
+    async def test_refresh_ticker_prices_keeps_snapshot_on_error(self, detector, mock_exchanges):
+        """
+        Test that an exchange failing to return tickers keeps its snapshot prices
+        """
+        mock_exchanges['okx'].fetch_tickers.side_effect = ConnectionError('down')
+        top_pairs = self.snapshot('binance', 'okx')
+        top_pairs['okx']['WETH/USDC']['last_price'] = 1990
+
+        market_data = await detector.refresh_ticker_prices(top_pairs)
+
+        assert market_data['binance']['WETH/USDC']['last_price'] == 2000
+        assert market_data['okx']['WETH/USDC']['last_price'] == 1990
+
+    @pytest.mark.parametrize('cache_ttl, expected_calls', [
+        # Cached snapshot on the second pass: prices re-read for its pairs
+        (3600, [(), (['WETH/USDC'],)]),
+        # Snapshot refetched every pass: already current, nothing re-read
+        (0, [(), ()])
+    ])
+    async def test_loop_makes_one_ticker_request_per_exchange_per_pass(
+        self,
+        detector,
+        tmp_path,
+        cache_ttl,
+        expected_calls
+    ):
+        """
+        Test that each loop pass queries every exchange for tickers exactly once
+        """
+        connector = MultiExchangeConnector(config_path=str(tmp_path / 'missing.yaml'))
+        connector.top_pairs_cache_ttl = cache_ttl
+        for name, price in (('binance', 2000), ('okx', 1950)):
+            exchange = MagicMock()
+            exchange.has = {'fetchTickers': True}
+            exchange.fetch_tickers = AsyncMock(
+                return_value={'WETH/USDC': {'quoteVolume': 1000000, 'last': price}}
+            )
+            connector.exchanges[name] = exchange
+        detector.multi_exchange_connector = connector
+
+        # Run two passes, stopping the loop at its second sleep
+        with patch('arbitrage_detector.store_top_trading_pairs'), \
+                patch('arbitrage_detector.store_arbitrage_opportunity'), \
+                patch('arbitrage_detector.asyncio.sleep', AsyncMock(
+                    side_effect=[None, asyncio.CancelledError()]
+                )):
+            with pytest.raises(asyncio.CancelledError):
+                await detector._run_arbitrage_loop(check_interval=60)
+
+        for exchange in connector.exchanges.values():
+            assert [c.args for c in exchange.fetch_tickers.call_args_list] == expected_calls
+            exchange.fetch_ticker.assert_not_called()
+
+    async def test_no_arbitrage_opportunity(self, detector, mock_exchanges):
+        """
+        Test scenario with no arbitrage opportunity
+        """
+        # Simulate exchanges with very similar prices
+        mock_exchanges['binance'].fetch_tickers.return_value = {'WETH/USDC': {'last': 2000}}
+        mock_exchanges['okx'].fetch_tickers.return_value = {'WETH/USDC': {'last': 2005}}
+
+        market_data = await detector.refresh_ticker_prices(self.snapshot('binance', 'okx'))
+        opportunities = await detector.detect_arbitrage_opportunities(market_data)
+
         # Assertions
-        assert success is False
-        assert opportunity_id is None
+        assert opportunities == []
 
     def test_error_handling(self):
         """
@@ -0,0 +1,37 @@
+import pytest
+
+from connectors.connector_factory import ConnectorFactory
+
+class TestConnectorFactory:
+    """Test cases for the ConnectorFactory connector cache"""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Start and end every test with an empty connector cache"""
+        ConnectorFactory._connectors.clear()
+        yield
+        ConnectorFactory._connectors.clear()
+
+    def test_connector_is_reused_per_config_path(self, tmp_path):
+        """Test that repeated calls with the same config path share one connector"""
+        config_path = str(tmp_path / 'exchanges.yaml')
+
+        first = ConnectorFactory.create_connector(config_path)
+
+        assert ConnectorFactory.create_connector(config_path) is first
+        assert ConnectorFactory.create_connector(str(tmp_path / 'other.yaml')) is not first
+
+    def test_invalidate_connector_forces_rebuild(self, tmp_path):
+        """Test that an invalidated connector is rebuilt on the next call"""
+        config_path = str(tmp_path / 'exchanges.yaml')
+        first = ConnectorFactory.create_connector(config_path)
+
+        ConnectorFactory.invalidate_connector(config_path)
+
+        assert ConnectorFactory.create_connector(config_path) is not first
+
+    def test_invalidate_unknown_connector_is_noop(self, tmp_path):
+        """Test that invalidating a path that was never built does not fail"""
+        ConnectorFactory.invalidate_connector(str(tmp_path / 'missing.yaml'))
+
+        assert ConnectorFactory._connectors == {}
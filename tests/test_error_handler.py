@@ -0,0 +1,65 @@
+import pytest
+from unittest.mock import MagicMock, patch
+
+from error_handler import ArbitrageError, ErrorHandler
+
+class TestCriticalErrorHandler:
+    """Test cases for the critical_error_handler decorator"""
+    
+    def test_sync_function_errors_are_handled(self):
+        """Test that exceptions from a sync function are handled and re-raised"""
+        @ErrorHandler.critical_error_handler
+        def failing():
+            raise ValueError("sync failure")
+        
+        with patch.object(ErrorHandler, 'handle_error') as mock_handle:
+            with pytest.raises(ValueError):
+                failing()
+        
+        mock_handle.assert_called_once()
+    
+    async def test_coroutine_errors_are_handled(self):
+        """Test that exceptions raised inside a coroutine are handled and re-raised"""
+        @ErrorHandler.critical_error_handler
+        async def failing():
+            raise ValueError("async failure")
+        
+        with patch.object(ErrorHandler, 'handle_error') as mock_handle:
+            with pytest.raises(ValueError):
+                await failing()
+        
+        mock_handle.assert_called_once()
+    
+    async def test_coroutine_result_is_returned(self):
+        """Test that the decorated coroutine still returns its result"""
+        @ErrorHandler.critical_error_handler
+        async def succeeding(value):
+            return value * 2
+        
+        assert await succeeding(21) == 42
+        assert succeeding.__name__ == 'succeeding'
+
+def test_error_code_is_stable_for_same_message():
+    """Test that identical messages produce identical error codes"""
+    with patch.object(ArbitrageError, '_log_error'), \
+         patch.object(ArbitrageError, '_report_error'):
+        first = ArbitrageError("Gas price unavailable")
+        second = ArbitrageError("Gas price unavailable")
+    
+    assert first.error_code == second.error_code
+    assert len(first.error_code) == 8
+
+@pytest.mark.parametrize('dsn, reported', [
+    (None, False),
+    ('', False),
+    ('https://key@o0.ingest.sentry.io/0', True)
+])
+def test_error_is_reported_only_with_sentry_dsn(dsn, reported):
+    """Test that errors reach Sentry only when a DSN is configured"""
+    client = MagicMock(dsn=dsn)
+    with patch.object(ArbitrageError, '_log_error'), \
+         patch('error_handler.sentry_sdk.get_client', return_value=client), \
+         patch('error_handler.sentry_sdk.capture_exception') as mock_capture:
+        ArbitrageError("Gas price unavailable")
+    
+    assert mock_capture.called is reported
@@ -0,0 +1,29 @@
+import pytest
+from decimal import Decimal
+
+from fund_manager import to_decimal
+
+class TestToDecimal:
+    """Test cases for the to_decimal conversion helper"""
+
+    @pytest.mark.parametrize('value, expected', [
+        (10**18, Decimal('1000000000000000000')),
+        ('2000.5', Decimal('2000.5')),
+        (0.1, Decimal('0.1')),
+        (1e-7, Decimal('1E-7'))
+    ])
+    def test_converts_supported_types(self, value, expected):
+        """Test that ints, strings and floats convert to the expected value"""
+        assert to_decimal(value) == expected
+
+    def test_decimal_is_returned_unchanged(self):
+        """Test that Decimal input is passed through without conversion"""
+        value = Decimal('1.23')
+
+        assert to_decimal(value) is value
+
+    @pytest.mark.parametrize('value', ['abc', '', True, None, [1]])
+    def test_invalid_values_raise_value_error(self, value):
+        """Test that unparseable values raise ValueError, not InvalidOperation"""
+        with pytest.raises(ValueError):
+            to_decimal(value)
@@ -0,0 +1,197 @@
+import time
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from gas_manager import GWEI, GasManager, GasStrategy
+
+TTL = 10.0
+
+def fee_history(base_fee_gwei, priority_fee_gwei):
+    """Build an eth_feeHistory response for a single block"""
+    return {
+        'baseFeePerGas': [base_fee_gwei * GWEI, base_fee_gwei * GWEI],
+        'reward': [[priority_fee_gwei * GWEI]]
+    }
+
+class TestGasStrategy:
+    """Test cases for GasStrategy fee math, all in integer wei"""
+
+    def test_priority_fee_gets_20_percent_buffer(self):
+        """Test that the priority fee is raised by 20% using integer division"""
+        strategy = GasStrategy(base_fee=30 * GWEI, priority_fee=2 * GWEI + 1, max_fee=500 * GWEI)
+
+        gas_price = strategy.calculate_gas_price()
+
+        assert gas_price['priority_fee'] == (2 * GWEI + 1) * 6 // 5
+        assert isinstance(gas_price['priority_fee'], int)
+        assert gas_price['base_fee'] == 30 * GWEI
+        assert gas_price['max_fee_per_gas'] == 500 * GWEI
+
+    def test_priority_fee_is_clamped_to_max_fee_headroom(self):
+        """Test that base fee plus priority fee never exceeds the max fee"""
+        strategy = GasStrategy(base_fee=99 * GWEI, priority_fee=5 * GWEI, max_fee=100 * GWEI)
+
+        assert strategy.calculate_gas_price()['priority_fee'] == 1 * GWEI
+
+    def test_gas_price_is_read_only(self):
+        """Test that the shared gas price mapping cannot be changed in place"""
+        strategy = GasStrategy(base_fee=30 * GWEI, priority_fee=2 * GWEI)
+        gas_price = strategy.calculate_gas_price()
+
+        with pytest.raises(TypeError):
+            gas_price['priority_fee'] = 0
+
+        assert strategy.calculate_gas_price()['priority_fee'] == 2 * GWEI * 6 // 5
+        assert dict(gas_price) == dict(strategy.calculate_gas_price())
+
+    def test_max_fee_defaults_to_twice_base_fee(self):
+        """Test the default max fee when none is configured"""
+        strategy = GasStrategy(base_fee=30 * GWEI, priority_fee=2 * GWEI)
+
+        assert strategy.max_fee == 60 * GWEI
+
+    def test_max_price_gwei_is_converted_to_wei(self):
+        """Test that gas.max_price_gwei is read as gwei and kept as integer wei"""
+        settings = {'gas.max_price_gwei': '42.5'}
+        with patch('gas_manager.config') as config:
+            config.get.side_effect = lambda key, default=None: settings.get(key, default)
+            gas_manager = GasManager(MagicMock(), async_w3=MagicMock())
+
+        assert gas_manager.max_gas_price == 42_500_000_000
+        assert isinstance(gas_manager.max_gas_price, int)
+
+    def test_estimate_transaction_cost_is_wei(self):
+        """Test that the cost is gas limit times base plus priority fee, in wei"""
+        gas_manager = GasManager(MagicMock(), async_w3=MagicMock())
+        strategy = GasStrategy(base_fee=30 * GWEI, priority_fee=2 * GWEI)
+
+        cost = gas_manager.estimate_transaction_cost(21000, strategy)
+
+        assert cost == 21000 * 32 * GWEI
+        assert isinstance(cost, int)
+
+class TestGasManagerCache:
+    """Test cases for the GasManager TTL cache and background refresh"""
+
+    @pytest.fixture
+    def gas_manager(self):
+        """Create a GasManager whose fee history RPC is mocked"""
+        async_w3 = MagicMock()
+        async_w3.eth.fee_history = AsyncMock(return_value=fee_history(30, 2))
+
+        gas_manager = GasManager(MagicMock(), async_w3=async_w3)
+        gas_manager.gas_cache_ttl = TTL
+        return gas_manager
+
+    def cache(self, gas_manager, age):
+        """Seed the ethereum cache entry with a strategy `age` seconds old"""
+        strategy = GasStrategy(base_fee=20 * GWEI, priority_fee=1 * GWEI)
+        gas_manager._gas_cache['ethereum'] = (time.monotonic() - age, strategy)
+        return strategy
+
+    async def test_concurrent_misses_share_one_fetch(self, gas_manager):
+        """Test that concurrent callers on an empty cache wait on a single RPC"""
+        async def slow_fee_history(*args):
+            await asyncio.sleep(0.01)
+            return fee_history(30, 2)
+
+        gas_manager.async_w3.eth.fee_history.side_effect = slow_fee_history
+
+        strategies = await asyncio.gather(
+            *[gas_manager.get_gas_price('ethereum') for _ in range(5)]
+        )
+
+        assert gas_manager.async_w3.eth.fee_history.await_count == 1
+        assert all(strategy is strategies[0] for strategy in strategies)
+        assert strategies[0].base_fee == 30 * GWEI
+
+    @pytest.mark.parametrize('age', [0.0, TTL * 0.99])
+    async def test_fresh_entry_is_served_from_cache(self, gas_manager, age):
+        """Test that entries younger than the TTL skip the RPC"""
+        cached = self.cache(gas_manager, age)
+
+        assert await gas_manager.get_gas_price('ethereum') is cached
+        await asyncio.sleep(0)
+
+        gas_manager.async_w3.eth.fee_history.assert_not_called()
+        assert not gas_manager._refresh_tasks
+
+    @pytest.mark.parametrize('age', [TTL * 1.01, TTL * 1.99])
+    async def test_stale_entry_triggers_one_refresh(self, gas_manager, age):
+        """Test that stale entries are served while exactly one refresh runs"""
+        cached = self.cache(gas_manager, age)
+
+        strategies = await asyncio.gather(
+            *[gas_manager.get_gas_price('ethereum') for _ in range(5)]
+        )
+        assert all(strategy is cached for strategy in strategies)
+
+        await gas_manager._refresh_tasks['ethereum']
+
+        assert gas_manager.async_w3.eth.fee_history.await_count == 1
+        assert gas_manager._gas_cache['ethereum'][1].base_fee == 30 * GWEI
+
+    @pytest.mark.parametrize('age', [TTL * 2.01, TTL * 10])
+    async def test_expired_entry_is_refetched(self, gas_manager, age):
+        """Test that entries older than twice the TTL are refetched inline"""
+        cached = self.cache(gas_manager, age)
+
+        strategy = await gas_manager.get_gas_price('ethereum')
+
+        assert strategy is not cached
+        assert strategy.base_fee == 30 * GWEI
+        assert gas_manager.async_w3.eth.fee_history.await_count == 1
+        assert not gas_manager._refresh_tasks
+
+    async def test_refresh_skips_fetch_when_entry_became_fresh(self, gas_manager):
+        """Test that a refresh waiting on the lock does not refetch a fresh entry"""
+        cached = self.cache(gas_manager, TTL * 1.5)
+
+        async with gas_manager._fetch_lock('ethereum'):
+            refresh = asyncio.ensure_future(gas_manager._refresh_gas_price('ethereum'))
+            await asyncio.sleep(0)
+            # Another fetch completes while the refresh waits on the lock
+            fresh = self.cache(gas_manager, 0)
+
+        await refresh
+
+        gas_manager.async_w3.eth.fee_history.assert_not_called()
+        assert gas_manager._gas_cache['ethereum'][1] is fresh
+        assert fresh is not cached
+
+class TestGasManagerClient:
+    """Test cases for the GasManager async client lifecycle"""
+
+    def test_non_http_provider_requires_async_client(self):
+        """Test that IPC/WebSocket-backed managers must be given async_w3"""
+        w3 = MagicMock()
+        w3.provider = MagicMock(spec=[])
+
+        with pytest.raises(ValueError):
+            GasManager(w3)
+
+    async def test_close_disconnects_derived_client(self):
+        """Test that close() disconnects the client derived from an HTTP provider"""
+        w3 = MagicMock()
+        w3.provider.endpoint_uri = 'http://localhost:8545'
+        gas_manager = GasManager(w3)
+        gas_manager.async_w3.provider.disconnect = AsyncMock()
+
+        await gas_manager.close()
+
+        assert gas_manager.async_w3.provider.endpoint_uri == 'http://localhost:8545'
+        gas_manager.async_w3.provider.disconnect.assert_awaited_once()
+
+    async def test_close_leaves_injected_client_open(self):
+        """Test that close() cancels refreshes but keeps a caller-owned client open"""
+        async_w3 = MagicMock()
+        async_w3.provider.disconnect = AsyncMock()
+        gas_manager = GasManager(MagicMock(), async_w3=async_w3)
+        refresh = asyncio.ensure_future(asyncio.sleep(60))
+        gas_manager._refresh_tasks['ethereum'] = refresh
+
+        await gas_manager.close()
+
+        assert refresh.cancelled()
+        async_w3.provider.disconnect.assert_not_called()
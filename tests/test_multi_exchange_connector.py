@@ -0,0 +1,86 @@
+import time
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from connectors.multi_exchange_connector import MultiExchangeConnector
+
+FETCH_DELAY = 0.05
+
+
+def make_exchange(tickers):
+    """Create a mock CCXT exchange whose fetch_tickers takes FETCH_DELAY seconds"""
+    async def fetch_tickers():
+        await asyncio.sleep(FETCH_DELAY)
+        return tickers
+
+    exchange = MagicMock()
+    exchange.fetch_tickers = AsyncMock(side_effect=fetch_tickers)
+    return exchange
+
+
+class TestMultiExchangeConnector:
+    @pytest.fixture
+    def connector(self, tmp_path):
+        """Create a connector with no configured exchanges"""
+        connector = MultiExchangeConnector(config_path=str(tmp_path / 'missing.yaml'))
+        connector.exchanges = {
+            name: make_exchange({
+                'WETH/USDC': {'quoteVolume': 300, 'last': 2000},
+                'WBTC/USDT': {'quoteVolume': 200, 'last': 40000},
+                'LINK/USDT': {'quoteVolume': 100, 'last': 15}
+            })
+            for name in ('binance', 'okx', 'coinbase', 'kraken')
+        }
+        return connector
+
+    async def test_fetch_top_trading_pairs_is_concurrent(self, connector):
+        """
+        Test that exchanges are queried concurrently rather than one by one
+        """
+        start = time.monotonic()
+        top_pairs = await connector.fetch_top_trading_pairs(limit=2)
+        elapsed = time.monotonic() - start
+
+        assert elapsed < FETCH_DELAY * len(connector.exchanges)
+        assert set(top_pairs) == set(connector.exchanges)
+        assert list(top_pairs['binance']) == ['WETH/USDC', 'WBTC/USDT']
+
+    @pytest.mark.parametrize('error', [ConnectionError('down'), asyncio.CancelledError()])
+    async def test_fetch_top_trading_pairs_skips_failed_exchange(self, connector, error):
+        """
+        Test that one failing or cancelled exchange does not drop the others
+        """
+        connector.exchanges['okx'].fetch_tickers.side_effect = error
+
+        top_pairs = await connector.fetch_top_trading_pairs(limit=2)
+
+        assert 'okx' not in top_pairs
+        assert set(top_pairs) == {'binance', 'coinbase', 'kraken'}
+
+    async def test_fetch_top_trading_pairs_uses_cache(self, connector):
+        """
+        Test that repeated calls within the TTL reuse the cached snapshot
+        """
+        first = await connector.fetch_top_trading_pairs(limit=2)
+        second = await connector.fetch_top_trading_pairs(limit=2)
+
+        assert second is first
+        for exchange in connector.exchanges.values():
+            assert exchange.fetch_tickers.await_count == 1
+
+    async def test_fetch_top_trading_pairs_does_not_cache_failures(self, connector):
+        """
+        Test that a snapshot with a failed exchange is refetched on the next call
+        """
+        fetch_tickers = connector.exchanges['okx'].fetch_tickers
+        working = fetch_tickers.side_effect
+        fetch_tickers.side_effect = ConnectionError('down')
+        await connector.fetch_top_trading_pairs(limit=2)
+
+        fetch_tickers.side_effect = working
+        top_pairs = await connector.fetch_top_trading_pairs(limit=2)
+
+        assert 'okx' in top_pairs
+        for exchange in connector.exchanges.values():
+            assert exchange.fetch_tickers.await_count == 2
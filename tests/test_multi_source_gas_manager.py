@@ -0,0 +1,129 @@
+import time
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from gas_manager import GWEI
+from multi_source_gas_manager import GasManager, GasStrategy, MultiSourceGasManager
+
+def make_source(base_fee_gwei=None, error=None):
+    """Create a mock gas source returning a strategy or raising `error`"""
+    source = MagicMock()
+    if error is not None:
+        source.get_gas_price = AsyncMock(side_effect=error)
+    else:
+        source.get_gas_price = AsyncMock(return_value=GasStrategy(
+            base_fee=base_fee_gwei * GWEI,
+            priority_fee=1 * GWEI,
+            max_fee=base_fee_gwei * 3 * GWEI
+        ))
+    return source
+
+class TestMultiSourceGasManager:
+    """Test cases for gas price aggregation across sources"""
+
+    async def test_low_median_of_all_sources(self):
+        """Test that fees are the low median of every source's strategy"""
+        manager = MultiSourceGasManager([make_source(10), make_source(30), make_source(20)])
+
+        strategy = await manager.get_gas_price('ethereum')
+
+        assert strategy.base_fee == 20 * GWEI
+        assert strategy.max_fee == 60 * GWEI
+        for source in manager.sources:
+            source.get_gas_price.assert_awaited_once_with('ethereum')
+
+    async def test_failing_source_is_skipped_until_backoff_ends(self):
+        """Test that a failed source is not queried again until its backoff expires"""
+        failing = make_source(error=ConnectionError('rate limited'))
+        manager = MultiSourceGasManager([make_source(10), failing])
+
+        await manager.get_gas_price('ethereum')
+        failures, backoff_until = manager._source_state[(failing, 'ethereum')]
+        assert failures == 1
+        assert backoff_until > time.monotonic()
+
+        await manager.get_gas_price('ethereum')
+        assert failing.get_gas_price.await_count == 1
+
+        # Backoff expired
+        manager._source_state[(failing, 'ethereum')] = (failures, time.monotonic() - 1)
+        await manager.get_gas_price('ethereum')
+        assert failing.get_gas_price.await_count == 2
+        assert manager._source_state[(failing, 'ethereum')][0] == 2
+
+    async def test_failure_count_resets_on_success(self):
+        """Test that a recovered source loses its failure history"""
+        source = make_source(10)
+        manager = MultiSourceGasManager([source])
+        manager._source_state[(source, 'ethereum')] = (3, time.monotonic() - 1)
+
+        await manager.get_gas_price('ethereum')
+
+        assert (source, 'ethereum') not in manager._source_state
+
+    async def test_backoff_is_capped(self):
+        """Test that the backoff grows as 2**failures up to max_backoff_seconds"""
+        failing = make_source(error=ConnectionError('down'))
+        manager = MultiSourceGasManager([make_source(10), failing])
+        manager._source_state[(failing, 'ethereum')] = (10, time.monotonic() - 1)
+
+        await manager.get_gas_price('ethereum')
+
+        failures, backoff_until = manager._source_state[(failing, 'ethereum')]
+        assert failures == 11
+        assert 299 < backoff_until - time.monotonic() <= manager.max_backoff_seconds
+
+    async def test_raises_when_every_source_is_backed_off(self):
+        """Test that a ValueError is raised when no source can be queried"""
+        sources = [make_source(10), make_source(20)]
+        manager = MultiSourceGasManager(sources)
+        for source in sources:
+            manager._source_state[(source, 'ethereum')] = (1, time.monotonic() + 60)
+
+        with pytest.raises(ValueError):
+            await manager.get_gas_price('ethereum')
+
+        for source in sources:
+            source.get_gas_price.assert_not_called()
+
+    async def test_backoff_is_per_chain(self):
+        """Test that a source failing on one chain is still queried for another"""
+        async_w3 = MagicMock()
+        async_w3.eth.fee_history = AsyncMock(return_value={
+            'baseFeePerGas': [10 * GWEI, 10 * GWEI],
+            'reward': [[1 * GWEI]]
+        })
+        source = GasManager(MagicMock(), async_w3=async_w3)
+        manager = MultiSourceGasManager([source])
+
+        # Unsupported chain: the source fails and is backed off for it
+        with pytest.raises(ValueError):
+            await manager.get_gas_price('polygon')
+        strategy = await manager.get_gas_price('ethereum')
+
+        assert strategy.base_fee == 10 * GWEI
+        assert (source, 'polygon') in manager._source_state
+        assert (source, 'ethereum') not in manager._source_state
+
+    async def test_cancelled_source_is_treated_as_failure(self):
+        """Test that a source cancelled mid-request is backed off, not aggregated"""
+        cancelled = make_source(error=asyncio.CancelledError())
+        manager = MultiSourceGasManager([make_source(10), cancelled])
+
+        strategy = await manager.get_gas_price('ethereum')
+
+        assert strategy.base_fee == 10 * GWEI
+        assert manager._source_state[(cancelled, 'ethereum')][0] == 1
+
+    async def test_from_rpc_urls(self):
+        """Test that each RPC URL becomes a GasManager source on that endpoint"""
+        rpc_urls = ['http://node-a:8545', 'https://node-b.example']
+        manager = MultiSourceGasManager.from_rpc_urls(rpc_urls)
+
+        try:
+            assert [
+                source.async_w3.provider.endpoint_uri for source in manager.sources
+            ] == rpc_urls
+        finally:
+            await manager.close()